@@ -0,0 +1,17 @@
+// Clientside helpers for the Fraud Detection dashboard (loaded automatically by Dash).
+window.dash_clientside = Object.assign({}, window.dash_clientside, {
+    dd: {
+        // Rebuild a Plotly figure from a server-built shell, its x/y/z arrays and the shared template
+        figure: function (store, template) {
+            if (!store) {
+                return window.dash_clientside.no_update;
+            }
+            var fig = JSON.parse(JSON.stringify(store.shell));
+            fig.layout.template = template;
+            fig.data.forEach(function (trace, i) {
+                Object.assign(trace, store.arrays[i]);
+            });
+            return fig;
+        }
+    }
+});
@@ -6,13 +6,18 @@
 #        actionable, minimal recommendations with jump-to-chart links.
 # =====================================================
 
-import os, base64, json
+import os, json, re, hashlib
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import islice
 import pandas as pd
 import numpy as np
 import dash
-from dash import dcc, html, dash_table, Input, Output, State, ALL
+from dash import dcc, html, dash_table, Input, Output, State, ALL, ClientsideFunction
 import plotly.express as px
-from flask import Response  # for /healthz
+import plotly.graph_objects as go
+import plotly.io as pio
+from flask import Response, request  # for /healthz + asset caching
 
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 
@@ -20,7 +25,13 @@ FILE_PATH = os.getenv(
     "DATA_FILE",
     os.path.join(BASE_DIR, "Fraud_Take_Home_Sheet_(3).xlsx")
 )
-LOGO_PATH = os.path.join(BASE_DIR, "DoorDashLogo.svg")
+CACHE_PATH = FILE_PATH + ".parquet"  # columnar copy of the sheet, rebuilt when stale
+# Precomputed aggregates live under one directory per resolved data file
+AGG_CACHE_DIR = os.path.join(
+    BASE_DIR, ".cache",
+    f"{os.path.basename(FILE_PATH)}-{hashlib.sha1(os.path.realpath(FILE_PATH).encode()).hexdigest()[:12]}",
+)
+LOGO_PATH = os.path.join(BASE_DIR, "assets", "DoorDashLogo.svg")  # served by Dash from /assets/
 
 # ---------- DoorDash-ish Theme ----------
 DD_RED = "#EB1700"
@@ -33,46 +44,54 @@ DD_MUTE = "#6B7280"
 DD_BORDER = "#E5E7EB"
 DD_HILITE = "#FFEDE7"  # subtle highlight for targeted rec card
 
-px.defaults.template = "plotly_white"
+# Figures and Dash responses both serialize via plotly.io.json → orjson (C, numpy-aware)
+pio.json.config.default_engine = "orjson"
+
+# Chart theme registered once as a template ("dd" = plotly_white + DoorDash styling)
+_DD_MARGIN = dict(l=16, r=16, t=16, b=16)
+_DD_AXIS = dict(showgrid=True, gridcolor="#F1F5F9", zeroline=False)
+pio.templates["dd"] = pio.templates.merge_templates("plotly_white", go.layout.Template(layout=dict(
+    margin=_DD_MARGIN,
+    plot_bgcolor=DD_CARD_BG,
+    paper_bgcolor=DD_CARD_BG,
+    font=dict(color=DD_TEXT, size=13),
+    legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="left", x=0),
+    hoverlabel=dict(bgcolor="white"),
+    xaxis=_DD_AXIS,
+    yaxis=_DD_AXIS,
+)))
+px.defaults.template = "dd"
 px.defaults.color_discrete_sequence = [DD_RED, "#334155", "#0EA5E9", "#14B8A6", "#F59E0B", "#6366F1"]
 
 # ---------- Logo Loader ----------
-def load_logo_src():
+def load_logo_src(app):
+    """Asset URL for the logo (cache-busted by mtime so browsers can keep it forever)."""
     if LOGO_PATH and os.path.exists(LOGO_PATH):
-        ext = os.path.splitext(LOGO_PATH)[1].lower()
-        mime = "image/png" if ext == ".png" else "image/svg+xml"
-        with open(LOGO_PATH, "rb") as f:
-            b64 = base64.b64encode(f.read()).decode()
-        return f"data:{mime};base64,{b64}"
+        url = app.get_asset_url(os.path.basename(LOGO_PATH))
+        return f"{url}?m={int(os.path.getmtime(LOGO_PATH))}"
     # Fallback red square
     return ("data:image/svg+xml;utf8,"
             "<svg xmlns='http://www.w3.org/2000/svg' width='40' height='40'>"
             "<rect width='40' height='40' fill='%23EB1700'/></svg>")
 
-LOGO_SRC = load_logo_src()
-
 # ---------- Helpers ----------
-def to_bool_int(series):
-    """Coerce various truthy/falsey values to 0/1."""
-    def _map(x):
-        if pd.isna(x):
-            return 0
-        s = str(x).strip().lower()
-        if s in {"1","true","t","yes","y"}:
-            return 1
-        if s in {"0","false","f","no","n"}:
-            return 0
-        try:
-            return 1 if float(s) != 0 else 0
-        except:
-            return 0
-    return series.apply(_map).astype(int)
+_TRUE = frozenset({"1","true","t","yes","y"})
+_FALSE = frozenset({"0","false","f","no","n"})
+_NAN = frozenset({"nan","+nan","-nan"})  # spellings float() accepts (input is already lower-cased)
 
-def safe_div(n, d):
-    try:
-        return float(n) / float(d) if d else 0.0
-    except:
-        return 0.0
+def to_bool_int(series):
+    """Coerce various truthy/falsey values to 0/1 (vectorized, int8)."""
+    if pd.api.types.is_numeric_dtype(series):
+        # Common case (0/1 already numeric): non-zero → 1, NaN → 0
+        return series.fillna(0).ne(0).astype("int8")
+    s = series.astype("string").str.strip().str.lower()
+    out = np.where(s.isin(_TRUE), 1, np.where(s.isin(_FALSE), 0, np.nan))
+    # Anything else: non-zero numerics → 1, unparseable/missing → 0.
+    # A literal "nan" token parses as float NaN, which is != 0 → 1 (as the original per-row float() check did).
+    # float() also takes digit-group underscores ("1_000"); to_numeric doesn't, so drop them first.
+    num = pd.to_numeric(s.str.replace(r"(?<=\d)_(?=\d)", "", regex=True), errors="coerce")
+    fallback = (num.fillna(0).ne(0) | s.isin(_NAN)).astype(int)
+    return pd.Series(out, index=series.index).fillna(fallback).astype("int8")
 
 def fmt_pct(x):
     try:
@@ -81,20 +100,15 @@ def fmt_pct(x):
         return "—"
 
 def theme_fig(fig):
-    """Minimal chart styling (no internal titles)."""
-    fig.update_layout(
-        title=None,
-        margin=dict(l=16, r=16, t=16, b=16),
-        plot_bgcolor=DD_CARD_BG,
-        paper_bgcolor=DD_CARD_BG,
-        font=dict(color=DD_TEXT, size=13),
-        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="left", x=0),
-        hoverlabel=dict(bgcolor="white"),
-    )
-    fig.update_xaxes(showgrid=True, gridcolor="#F1F5F9", zeroline=False)
-    fig.update_yaxes(showgrid=True, gridcolor="#F1F5F9", zeroline=False)
+    """Minimal chart styling (no internal titles); the rest comes from the "dd" template."""
+    # px writes its own layout.margin, which would beat the template's
+    fig.update_layout(template="dd", title=None, margin=_DD_MARGIN)
     return fig
 
+def _fig(fig):
+    """Themed figure as a plain dict, so Dash serializes it without another Figure→JSON pass."""
+    return theme_fig(fig).to_dict()
+
 def section_title(text):
     return html.Div(text, style={"color": DD_SLATE, "fontWeight": 700, "margin": "4px 0 6px 0"})
 
@@ -130,6 +144,16 @@ def badge(text):
         }
     )
 
+def rec_card_style(highlight=False):
+    """Card container style; the highlighted variant marks the targeted recommendation."""
+    return {
+        "background": DD_CARD_BG if not highlight else DD_HILITE,
+        "border": f"2px solid {DD_RED}" if highlight else f"1px solid {DD_BORDER}",
+        "borderRadius": "12px",
+        "padding": "12px 14px",
+        "boxShadow": "0 2px 10px rgba(16,20,24,0.04)"
+    }
+
 def rec_card(title, trigger, why, actions, kpis, tags=None, highlight=False, _id=None, significance=None):
     """Recommendation card with trigger, a short significance line, why, actions, and KPIs."""
     return html.Div(
@@ -159,13 +183,7 @@ def rec_card(title, trigger, why, actions, kpis, tags=None, highlight=False, _id
             ),
         ],
         id=_id,
-        style={
-            "background": DD_CARD_BG if not highlight else DD_HILITE,
-            "border": f"2px solid {DD_RED}" if highlight else f"1px solid {DD_BORDER}",
-            "borderRadius": "12px",
-            "padding": "12px 14px",
-            "boxShadow": "0 2px 10px rgba(16,20,24,0.04)"
-        },
+        style=rec_card_style(highlight),
     )
 
 def info_card(title, md_blocks):
@@ -225,19 +243,131 @@ def bubble_btn(label, key):
         },
     )
 
-# ---------- Load ----------
-df = pd.read_excel(FILE_PATH)
+_BUB_STYLE = {"margin": "4px 0 12px 0"}
 
-# ---------- Preprocess ----------
-df["CREATED_AT"] = pd.to_datetime(df.get("CREATED_AT"), errors="coerce")
-df["DATE"] = df["CREATED_AT"].dt.date
+def _bub_row(label, key):
+    """A single routing bubble on its own row under a chart."""
+    return html.Div([bubble_btn(label, key)], style=_BUB_STYLE)
 
-# Temporal helpers for heatmap
-df["HOUR"] = df["CREATED_AT"].dt.hour
-df["DOW"]  = df["CREATED_AT"].dt.dayofweek  # 0=Mon..6=Sun
-dow_map = {0:"Mon",1:"Tue",2:"Wed",3:"Thu",4:"Fri",5:"Sat",6:"Sun"}
-df["DOW_LABEL"] = df["DOW"].map(dow_map)
+# ---------- Load ----------
+def xlsx_to_parquet(src, dst, chunk_rows=10_000):
+    """Stream the first sheet into Parquet in bounded memory (openpyxl read-only → ParquetWriter).
+
+    The schema is pinned from the first chunk, typed like read_excel (integral floats → int64);
+    a later chunk that does not fit raises, and the caller falls back to pandas.
+    """
+    import openpyxl
+    import pyarrow as pa, pyarrow.compute as pc, pyarrow.parquet as pq
+
+    def _pin(col):
+        if pa.types.is_null(col.type):
+            return pa.float64()  # blank so far: read_excel would give float64 NaN
+        if pa.types.is_floating(col.type) and pc.all(pc.equal(col, pc.floor(col))).as_py():
+            return pa.int64()
+        return col.type
+
+    def _drop_trailing_blank(rows):
+        # Styled-but-empty rows below the data come through as all-None; read_excel drops them,
+        # so hold blank rows back and only emit them once a non-blank row follows
+        pending = []
+        for r in rows:
+            if all(v is None or v == "" for v in r):
+                pending.append(r)
+            else:
+                yield from pending
+                pending.clear()
+                yield r
+
+    wb = openpyxl.load_workbook(src, read_only=True, data_only=True)
+    writer = None
+    try:
+        rows = wb.worksheets[0].iter_rows(values_only=True)
+        header = [str(h) for h in next(rows)]
+        rows = _drop_trailing_blank(rows)
+        n = len(header)
+        for batch in iter(lambda: list(islice(rows, chunk_rows)), []):
+            # Read-only rows stop at their last non-empty cell → pad/trim to the header width
+            cols = zip(*(r[:n] + (None,) * (n - len(r)) for r in batch))
+            tbl = pa.Table.from_arrays([pa.array(c) for c in cols], names=header)
+            if writer is None:
+                schema = pa.schema([pa.field(name, _pin(c)) for name, c in zip(tbl.column_names, tbl.columns)])
+                writer = pq.ParquetWriter(dst, schema, compression="zstd")
+            writer.write_table(tbl.cast(writer.schema))
+    finally:
+        if writer is not None:
+            writer.close()
+        wb.close()
+    if writer is None:
+        raise ValueError(f"{src}: no data rows")
+
+def load_df():
+    """Read the sheet, reusing the Parquet cache when it is newer than the xlsx."""
+    if os.path.exists(CACHE_PATH) and os.path.getmtime(CACHE_PATH) >= os.path.getmtime(FILE_PATH):
+        return pd.read_parquet(CACHE_PATH, engine="pyarrow")
+    # Write-then-rename so concurrent Gunicorn workers never see a partial file
+    tmp = f"{CACHE_PATH}.{os.getpid()}.tmp"
+    parsed = None  # pandas fallback frame, kept so a failed write doesn't mean parsing the sheet twice
+    try:
+        try:
+            xlsx_to_parquet(FILE_PATH, tmp)
+        except OSError:
+            raise
+        except Exception:
+            # Irregular sheet (e.g. mixed-type column): let pandas infer dtypes in one go
+            parsed = pd.read_excel(FILE_PATH)
+            parsed.to_parquet(tmp, engine="pyarrow", compression="zstd")
+        os.replace(tmp, CACHE_PATH)
+    except Exception:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        if parsed is not None:
+            return parsed  # e.g. object column Arrow can't type: serve what pandas already read
+        return pd.read_excel(FILE_PATH)  # read-only disk / no pyarrow: serve straight from Excel
+    return pd.read_parquet(CACHE_PATH, engine="pyarrow")
+
+def agg_fingerprint():
+    """Identity of the inputs the aggregates were built from: data file + this module (path, size, mtime_ns)."""
+    parts = []
+    for path in (FILE_PATH, os.path.abspath(__file__)):
+        st = os.stat(path)
+        parts.append(f"{os.path.realpath(path)}:{st.st_size}:{st.st_mtime_ns}")
+    return "|".join(parts).encode()
+
+def cached_frame(name, build):
+    """Aggregate `name` from AGG_CACHE_DIR if it was built from the same inputs, else build + store it.
+
+    The fingerprint is stored in the Parquet file's own metadata, so frame and stamp are replaced together.
+    """
+    try:
+        import pyarrow as pa, pyarrow.parquet as pq
+    except ImportError:
+        return build()
+    path = os.path.join(AGG_CACHE_DIR, f"{name}.parquet")
+    fingerprint = agg_fingerprint()
+    try:
+        tbl = pq.read_table(path)
+        if (tbl.schema.metadata or {}).get(b"dd_fingerprint") == fingerprint:
+            return tbl.to_pandas()
+    except FileNotFoundError:
+        pass
+    except (OSError, pa.ArrowInvalid) as e:
+        print(f"[cache] rebuilding {name}: unreadable {path} ({e})")
+    out = build()
+    tmp = f"{path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(AGG_CACHE_DIR, exist_ok=True)
+        tbl = pa.Table.from_pandas(out)
+        tbl = tbl.replace_schema_metadata({**(tbl.schema.metadata or {}), b"dd_fingerprint": fingerprint})
+        pq.write_table(tbl, tmp)
+        os.replace(tmp, path)
+    except (OSError, pa.ArrowException):
+        if os.path.exists(tmp):
+            os.remove(tmp)  # read-only disk / unstorable frame: just keep the in-memory result
+    return out
+
+df = load_df()
 
+# ---------- Preprocess ----------
 # Numeric coercion
 numeric_cols = [
     "GOV", "CHARGEBACK_COST", "SIFT_CREATE_ORDER_PA_SCORE",
@@ -248,44 +378,87 @@ numeric_cols = [
     "CX_DEVICE_ORDER_NUM", "CX_ADDRESS_ORDER_NUM", "CX_CARD_ORDER_NUM", "CX_ORDER_NUM",
     "CX_AGE_ON_DELIVERY_BASED_ON_FIRST_ORDER"
 ]
-for c in numeric_cols:
-    if c in df.columns:
-        df[c] = pd.to_numeric(df[c], errors="coerce")
-
-# Booleans & label
-df["RECEIVED_CHARGEBACK"] = to_bool_int(df["RECEIVED_CHARGEBACK"]) if "RECEIVED_CHARGEBACK" in df.columns else 0
-df["IS_FRAUDULENT_CHARGEBACK"] = to_bool_int(df["IS_FRAUDULENT_CHARGEBACK"]) if "IS_FRAUDULENT_CHARGEBACK" in df.columns else 0
-df["FRAUD_FLAG"] = df["IS_FRAUDULENT_CHARGEBACK"].astype(int)
-
+present = [c for c in numeric_cols if c in df.columns]
+df[present] = df[present].apply(pd.to_numeric, errors="coerce").astype("float32")
+
+created = pd.to_datetime(df.get("CREATED_AT"), errors="coerce")
+# Wall-clock time in the column's own timezone: DATE_CODE, HOUR and DOW are all derived from it
+_wall = created.dt.tz_localize(None) if created.dt.tz is not None else created
+_day = _wall.to_numpy(dtype="datetime64[ns]").astype("datetime64[D]")
+dow = _wall.dt.dayofweek  # 0=Mon..6=Sun
+order_dow = ["Mon","Tue","Wed","Thu","Fri","Sat","Sun"]
+_no_flag = pd.Series(0, index=df.index, dtype="int8")
+fraudulent = to_bool_int(df["IS_FRAUDULENT_CHARGEBACK"]) if "IS_FRAUDULENT_CHARGEBACK" in df.columns else _no_flag
+
+# All derived columns go in with one assign (single block consolidation);
+# dtypes are compact up front: int8 flags, Int8 hour/dow, category labels.
+new_cols = {
+    "CREATED_AT": created,
+    # Calendar day as int epoch-day codes (cheap integer hashing for the daily rollup)
+    "DATE_CODE": pd.Series(_day.astype("int64"), index=df.index).where(~np.isnat(_day)).astype("Int32"),
+    # Temporal helpers for heatmap
+    "HOUR": _wall.dt.hour.astype("Int8"),
+    "DOW": dow.astype("Int8"),
+    # Booleans & label
+    "RECEIVED_CHARGEBACK": to_bool_int(df["RECEIVED_CHARGEBACK"]) if "RECEIVED_CHARGEBACK" in df.columns else _no_flag,
+    "IS_FRAUDULENT_CHARGEBACK": fraudulent,
+    "FRAUD_FLAG": fraudulent,
+}
 # Money normalization
 if "GOV" in df.columns:
-    df["GOV"] = pd.to_numeric(df["GOV"], errors="coerce").fillna(0)
-    df["GOV_DOLLARS"] = df["GOV"] / 100.0
+    new_cols["GOV"] = df["GOV"].fillna(0)
+    new_cols["GOV_DOLLARS"] = new_cols["GOV"] / 100.0
 else:
-    df["GOV_DOLLARS"] = 0.0
+    new_cols["GOV_DOLLARS"] = 0.0
+if "PLATFORM" in df.columns:
+    new_cols["PLATFORM"] = df["PLATFORM"].astype("category")
+df = df.assign(**new_cols)
+
+# Anything still 64-bit (IDs, columns outside numeric_cols) → narrowest dtype before corr/Plotly,
+# as one astype so the frame is consolidated once (like the assign above)
+def int_downcast_target(s):
+    """Smallest signed int dtype holding s's range (what to_numeric(downcast="integer") would pick)."""
+    if s.empty:
+        return np.dtype(np.int8)
+    lo, hi = s.min(), s.max()
+    for t in (np.int8, np.int16, np.int32):
+        if np.iinfo(t).min <= lo and hi <= np.iinfo(t).max:
+            return np.dtype(t)
+    return s.dtype
+
+_downcast = {c: "float32" for c in df.select_dtypes("float64").columns}
+_downcast.update({c: int_downcast_target(df[c]) for c in df.select_dtypes("int64").columns})
+if _downcast:
+    df = df.astype(_downcast)
 
 # ---------- KPIs ----------
 overall_deliveries = df["DELIVERY_ID"].nunique() if "DELIVERY_ID" in df.columns else len(df)
 overall_cb = int(df["RECEIVED_CHARGEBACK"].sum())
 overall_fraud = int(df["FRAUD_FLAG"].sum())
-overall_cb_rate = safe_div(overall_cb, overall_deliveries)
-overall_fraud_rate = safe_div(overall_fraud, overall_deliveries)
+overall_cb_rate = overall_cb / overall_deliveries if overall_deliveries else 0.0
+overall_fraud_rate = overall_fraud / overall_deliveries if overall_deliveries else 0.0
 overall_cb_cost = float(df.get("CHARGEBACK_COST", pd.Series([0])).fillna(0).sum())
 avg_gov = float(df["GOV_DOLLARS"].mean()) if "GOV_DOLLARS" in df.columns else 0.0
 avg_sift = float(df.get("SIFT_CREATE_ORDER_PA_SCORE", pd.Series([np.nan])).mean())
 
 # ---------- Daily Trends ----------
-daily = df.groupby("DATE", dropna=False, observed=False).agg(
-    deliveries=("DELIVERY_ID", "count"),
-    chargebacks=("RECEIVED_CHARGEBACK", "sum"),
-    fraudulent=("FRAUD_FLAG", "sum"),
-    cb_cost=("CHARGEBACK_COST", "sum"),
-    avg_sift=("SIFT_CREATE_ORDER_PA_SCORE", "mean"),
-    avg_gov=("GOV_DOLLARS", "mean")
-).reset_index()
-
-daily["chargeback_rate"] = (daily["chargebacks"] / daily["deliveries"].replace(0, np.nan)).fillna(0)
-daily["fraud_rate"] = (daily["fraudulent"] / daily["deliveries"].replace(0, np.nan)).fillna(0)
+def build_daily():
+    d = df.groupby("DATE_CODE", dropna=False, sort=True).agg(
+        deliveries=("DELIVERY_ID", "count"),
+        chargebacks=("RECEIVED_CHARGEBACK", "sum"),
+        fraudulent=("FRAUD_FLAG", "sum"),
+        cb_cost=("CHARGEBACK_COST", "sum"),
+        avg_sift=("SIFT_CREATE_ORDER_PA_SCORE", "mean"),
+        avg_gov=("GOV_DOLLARS", "mean")
+    ).reset_index()
+    d.insert(0, "DATE", pd.to_datetime(d.pop("DATE_CODE"), unit="D").astype("datetime64[ns]"))  # ns survives Parquet as-is
+
+    den = d["deliveries"].to_numpy(dtype=np.float64)
+    for rate, num in [("chargeback_rate", "chargebacks"), ("fraud_rate", "fraudulent")]:
+        d[rate] = np.divide(d[num].to_numpy(dtype=np.float64), den, out=np.zeros_like(den), where=den > 0)
+    return d
+
+daily = cached_frame("daily", build_daily)
 
 # ---------- Date-range note for KPIs (centered) ----------
 if not daily.empty:
@@ -296,59 +469,104 @@ else:
     kpi_date_note_text = "Data range: —"
 
 # ---------- Segments / Leading Signals ----------
-if "PLATFORM" in df.columns:
-    fraud_by_platform = (
-        df.groupby("PLATFORM", dropna=False, observed=False)["FRAUD_FLAG"]
-        .mean().reset_index().rename(columns={"FRAUD_FLAG": "fraud_rate"})
-    )
-else:
-    fraud_by_platform = pd.DataFrame(columns=["PLATFORM", "fraud_rate"])
-
-if "CX_UNIQUE_ADDRESSES" in df.columns:
-    fraud_by_addr = (
-        df.groupby("CX_UNIQUE_ADDRESSES", dropna=False, observed=False)["FRAUD_FLAG"]
-        .mean().reset_index().rename(columns={"FRAUD_FLAG": "fraud_rate"}).sort_values("CX_UNIQUE_ADDRESSES")
-    )
-else:
-    fraud_by_addr = pd.DataFrame(columns=["CX_UNIQUE_ADDRESSES", "fraud_rate"])
+_fraud_i8 = df["FRAUD_FLAG"].to_numpy(dtype=np.int8)  # 0/1 flag, narrow for the n×k correlation temporaries
+_fraud_w = _fraud_i8.astype(np.float64)  # bincount weights
+
+def fraud_rate_by(key):
+    """Mean FRAUD_FLAG per value of `key` (NaN kept as its own, last group), via bincount."""
+    codes, uniques = pd.factorize(df[key], sort=True, use_na_sentinel=False)
+    n = len(uniques)
+    hits = np.bincount(codes, weights=_fraud_w, minlength=n)
+    cnt = np.bincount(codes, minlength=n)
+    rate = np.divide(hits, cnt, out=np.full(n, np.nan), where=cnt > 0)
+    return pd.DataFrame({key: uniques, "fraud_rate": rate})
+
+def fraud_rate_or_empty(key):
+    return fraud_rate_by(key) if key in df.columns else pd.DataFrame(columns=[key, "fraud_rate"])
+
+# GOV decile bins, right-closed like qcut; string labels avoid the Interval JSON issue
+def gov_decile_bins(x):
+    """Return (codes, labels) for decile bins of `x`; duplicate edges are dropped."""
+    edges = np.unique(np.quantile(x, np.linspace(0, 1, 11)))
+    if edges.size < 2:
+        edges = np.repeat(edges, 2)
+    codes = np.clip(np.searchsorted(edges, x, side="left") - 1, 0, edges.size - 2)
+    # Add decimals until every edge prints distinctly (as qcut does), so labels stay unique
+    for prec in range(2, 18):
+        text = [f"{e:.{prec}f}" for e in edges]
+        if len(set(text)) == len(text):
+            break
+    else:
+        text = [repr(float(e)) for e in edges]
+    labels = [f"({text[i]}, {text[i+1]}]" for i in range(edges.size - 1)]
+    labels[0] = "[" + labels[0][1:]  # lowest bin includes its left edge
+    return codes.astype(np.int8), labels
 
-if "FAIL_CHARGES_1D" in df.columns:
-    fraud_by_failed = (
-        df.groupby("FAIL_CHARGES_1D", dropna=False, observed=False)["FRAUD_FLAG"]
-        .mean().reset_index().rename(columns={"FRAUD_FLAG": "fraud_rate"}).sort_values("FAIL_CHARGES_1D")
-    )
-else:
-    fraud_by_failed = pd.DataFrame(columns=["FAIL_CHARGES_1D", "fraud_rate"])
-
-# GOV bins as strings to avoid Interval JSON issue
 if "GOV_DOLLARS" in df.columns:
-    df["GOV_BIN"] = pd.qcut(df["GOV_DOLLARS"].fillna(0), q=10, duplicates="drop")
-    df["GOV_BIN_LABEL"] = df["GOV_BIN"].astype(str)
-    fraud_by_gov_bin = (
-        df.groupby("GOV_BIN_LABEL", dropna=False, observed=False)["FRAUD_FLAG"]
-        .mean().reset_index().rename(columns={"FRAUD_FLAG": "fraud_rate", "GOV_BIN_LABEL": "GOV_BIN"})
+    _gov_codes, _gov_labels = gov_decile_bins(df["GOV_DOLLARS"].fillna(0).to_numpy(dtype=np.float64))
+    df["GOV_BIN_LABEL"] = pd.Categorical.from_codes(_gov_codes, categories=_gov_labels, ordered=True)
+
+# The four segment tables only read df (all columns exist by now) → compute them side by side
+def segment_table(name, key):
+    return cached_frame(name, lambda: fraud_rate_or_empty(key).rename(columns={"GOV_BIN_LABEL": "GOV_BIN"}))
+
+with ThreadPoolExecutor(max_workers=4) as _ex:
+    fraud_by_platform, fraud_by_addr, fraud_by_failed, fraud_by_gov_bin = _ex.map(
+        segment_table,
+        ["fraud_by_platform", "fraud_by_addr", "fraud_by_failed", "fraud_by_gov_bin"],
+        ["PLATFORM", "CX_UNIQUE_ADDRESSES", "FAIL_CHARGES_1D", "GOV_BIN_LABEL"],
     )
-else:
-    fraud_by_gov_bin = pd.DataFrame(columns=["GOV_BIN", "fraud_rate"])
 
 # ---------- Temporal Heatmap (Day-of-Week × Hour) ----------
-heat = (
-    df.groupby(["DOW_LABEL","HOUR"], dropna=False, observed=False)["FRAUD_FLAG"]
-      .mean().reset_index().rename(columns={"FRAUD_FLAG":"fraud_rate"})
+# One 7×24 bincount over dow*24+hour; rows with missing timestamps are skipped.
+_valid = (df["DOW"].notna() & df["HOUR"].notna()).to_numpy()
+_cell = df["DOW"].to_numpy(dtype=np.int64, na_value=0)[_valid] * 24 + df["HOUR"].to_numpy(dtype=np.int64, na_value=0)[_valid]
+_heat_hits = np.bincount(_cell, weights=_fraud_w[_valid], minlength=7 * 24)
+_heat_cnt = np.bincount(_cell, minlength=7 * 24)
+heat_pivot = pd.DataFrame(
+    np.divide(_heat_hits, _heat_cnt, out=np.zeros(7 * 24), where=_heat_cnt > 0).reshape(7, 24),
+    index=pd.CategoricalIndex(order_dow, categories=order_dow, ordered=True, name="DOW_LABEL"),
+    columns=pd.Index(range(24), name="HOUR"),
+)
+
+# ---------- Predictors (univariate correlation with FRAUD_FLAG, computed once) ----------
+def corr_with(X, y):
+    """Pearson r of each column of X against y over pairwise-complete rows (as DataFrame.corr)."""
+    M = ~np.isnan(X)
+    n = M.sum(0)
+    with np.errstate(invalid="ignore", divide="ignore"):  # <2 rows / constant column → NaN
+        xc = np.where(M, X - np.where(M, X, 0).sum(0) / n, 0)
+        ym = np.where(M, y[:, None], 0)
+        yc = np.where(M, ym - ym.sum(0) / n, 0)
+        return (xc * yc).sum(0) / np.sqrt((xc ** 2).sum(0) * (yc ** 2).sum(0))
+
+_pred_X = df.select_dtypes(include=[np.number]).drop(
+    columns=["FRAUD_FLAG", "IS_FRAUDULENT_CHARGEBACK", "DATE_CODE"], errors="ignore"
+)
+_pred_corr = cached_frame("pred_corr", lambda: pd.DataFrame(
+    {"r": corr_with(_pred_X.to_numpy(dtype=np.float64, na_value=np.nan), _fraud_i8)},
+    index=_pred_X.columns,
+))["r"]
+# Top 20 by |r|, ascending so the strongest bar ends up on top of the horizontal chart
+pred_df = (
+    _pred_corr.reindex(_pred_corr.abs().sort_values(ascending=False).index).head(20)
+    .sort_values().rename_axis("Feature").reset_index(name="CorrelationWithFraud")
 )
-order_dow = ["Mon","Tue","Wed","Thu","Fri","Sat","Sun"]
-heat["DOW_LABEL"] = pd.Categorical(heat["DOW_LABEL"], categories=order_dow, ordered=True)
-heat_pivot = heat.pivot(index="DOW_LABEL", columns="HOUR", values="fraud_rate").fillna(0)
 
 # ---------- Quick Insight Helpers ----------
 def last_vs_prior_7d(series_dates, values):
-    s = pd.Series(values.values, index=pd.to_datetime(series_dates)).sort_index()
-    if s.empty: return None
-    last_date = s.index.max()
-    last7 = s[(s.index > last_date - pd.Timedelta(days=7))]
-    prior7 = s[(s.index > last_date - pd.Timedelta(days=14)) & (s.index <= last_date - pd.Timedelta(days=7))]
-    if len(last7) == 0 or len(prior7) == 0: return None
-    return float(last7.mean()), float(prior7.mean()), float(last7.mean() - prior7.mean())
+    """Mean over the last 7 calendar days vs the 7 before; dates must be sorted (daily is)."""
+    d = pd.to_datetime(series_dates).to_numpy(dtype="datetime64[D]")
+    v = np.asarray(values, dtype=np.float64)
+    ok = ~np.isnat(d)
+    d, v = d[ok], v[ok]
+    if d.size == 0: return None
+    last_date = d[-1]
+    i7 = np.searchsorted(d, last_date - np.timedelta64(7, "D"), side="right")
+    i14 = np.searchsorted(d, last_date - np.timedelta64(14, "D"), side="right")
+    if i14 == i7: return None
+    last7, prior7 = v[i7:].mean(), v[i14:i7].mean()
+    return float(last7), float(prior7), float(last7 - prior7)
 
 def insight_rates_trend():
     res_cb = last_vs_prior_7d(daily["DATE"], daily["chargeback_rate"])
@@ -383,7 +601,11 @@ def insight_sift_gov():
     if "GOV_DOLLARS" in df.columns:
         bullets.append(f"Average order value: ${avg_gov:,.2f}.")
     if {"avg_sift", "fraud_rate"}.issubset(daily.columns):
-        c = daily[["avg_sift", "fraud_rate"]].dropna().corr().iloc[0,1]
+        a = daily["avg_sift"].to_numpy(dtype=np.float64)
+        b = daily["fraud_rate"].to_numpy(dtype=np.float64)
+        m = np.isfinite(a) & np.isfinite(b)
+        with np.errstate(invalid="ignore", divide="ignore"):  # constant series → NaN, as pandas
+            c = np.corrcoef(a[m], b[m])[0, 1] if m.sum() > 1 else np.nan
         if not np.isnan(c):
             bullets.append(f"Sift vs fraud (daily) correlation: {c:+.2f} (directional).")
     return bullets[:3] if bullets else ["No Sift/GOV data available."]
@@ -438,6 +660,24 @@ def insight_heatmap():
         "Use hot zones to set rate limits / staffing / step-up windows.",
     ]
 
+# Insights depend only on the static dataset → compute the strings once at import
+INSIGHTS = {
+    "heatmap": insight_heatmap(),
+    "trend": insight_rates_trend(),
+    "cb_cost": insight_cb_cost(),
+    "sift_gov": insight_sift_gov(),
+    "platform": insight_platform(),
+    "addresses": insight_addresses(),
+    "failed": insight_failed(),
+    "govbin": insight_govbin(),
+}
+
+_INSIGHT_STYLE = {"color": DD_MUTE, "marginTop": "6px"}
+
+def _ul(key):
+    """Bullet list for one precomputed insight section."""
+    return html.Ul([html.Li(t) for t in INSIGHTS[key]], style=_INSIGHT_STYLE)
+
 # ---------- Glossary ----------
 glossary_items = [
     ("DELIVERY_ID", "ID of Order/Delivery."),
@@ -468,6 +708,21 @@ glossary_items = [
 ]
 glossary_df = pd.DataFrame(glossary_items, columns=["Field", "Definition"])
 glossary_map = dict(glossary_df.values)
+GLOSSARY_PAGE_SIZE = 10
+_GLOSSARY_RECORDS = glossary_df.to_dict("records")
+_GLOSSARY_COLS = [{"name": c, "id": c} for c in glossary_df.columns]
+
+@lru_cache(maxsize=8)
+def _glossary_sorted(column_id, ascending):
+    return glossary_df.sort_values(column_id, ascending=ascending, kind="stable").to_dict("records")
+
+def glossary_page(page_current, page_size, sort_by):
+    """One page of glossary rows, sorted server-side when the table asks for it."""
+    rows = _GLOSSARY_RECORDS
+    if sort_by:
+        rows = _glossary_sorted(sort_by[0]["column_id"], sort_by[0]["direction"] == "asc")
+    start = (page_current or 0) * page_size
+    return rows[start:start + page_size]
 
 # ---- Recommendation definitions (keys → content) ----
 REC_DEFS = {
@@ -578,6 +833,15 @@ server = app.server
 def healthz():
     return Response("ok", status=200)
 
+@server.after_request
+def cache_static_assets(resp):
+    # Asset URLs carry an mtime query, so a year-long immutable cache is safe
+    if resp.status_code == 200 and request.path.startswith(app.config.routes_pathname_prefix + "assets/"):
+        resp.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+    return resp
+
+LOGO_SRC = load_logo_src(app)
+
 tabs_styles = {"height": "44px", "border": "none"}
 tab_style = {
     "padding": "10px 16px",
@@ -596,18 +860,32 @@ tab_selected_style = {
     "color": DD_RED_DARK,
 }
 
-def build_rec_cards(selected_key=None):
-    """Return list of recommendation card components, selected one first + highlighted."""
-    cards = []
-    for key, cfg in REC_DEFS.items():
-        cards.append((key, rec_card(
-            title=cfg["title"], trigger=cfg["trigger"], significance=cfg.get("significance"),
-            why=cfg["why"], actions=cfg["actions"], kpis=cfg["kpis"], tags=cfg["tags"],
-            highlight=(key == selected_key), _id=f"rec-{key}"
-        )))
-    if selected_key and selected_key in REC_DEFS:
-        cards.sort(key=lambda x: 0 if x[0]==selected_key else 1)
-    return [c for _, c in cards]
+# Recommendation cards are static: build once; selection only restyles them (clientside)
+PREBUILT_REC_CARDS = [
+    rec_card(**cfg, _id={"type": "rec-card", "key": key}) for key, cfg in REC_DEFS.items()
+]
+
+# ---------- Static figures (built + serialized once per process) ----------
+HEAT_FIG = theme_fig(px.imshow(
+    heat_pivot,  # pass DF so labels render
+    aspect="auto",
+    labels=dict(color="Fraud Rate"),
+))  # heat_pivot is always 7×24 (empty cells are 0), so no fallback figure is needed
+TREND_FIG = theme_fig(px.line(daily, x="DATE", y=["chargeback_rate", "fraud_rate"]))
+
+def figure_store(fig):
+    """Split a figure into a data-free shell + per-trace x/y/z arrays (rebuilt by dd.figure in assets/)."""
+    spec = json.loads(fig.to_json())
+    spec["layout"].pop("template", None)  # shipped once via the fig-template store
+    arrays = [{k: t.pop(k) for k in ("x", "y", "z") if k in t} for t in spec["data"]]
+    return {"shell": spec, "arrays": arrays}
+
+FIG_TEMPLATE = json.loads(HEAT_FIG.to_json())["layout"]["template"]  # same px template for all figures
+HEAT_STORE = figure_store(HEAT_FIG)
+TREND_STORE = figure_store(TREND_FIG)
+
+# Long form up front so px.line doesn't melt the wide frame itself
+daily_long = daily.melt(id_vars="DATE", value_vars=["avg_sift", "avg_gov"], var_name="metric", value_name="value")
 
 # ---------- Layout builder ----------
 def build_tabs():
@@ -685,48 +963,42 @@ def build_tabs():
             html.Br(),
 
             section_title("Temporal Fraud Heatmap (Day-of-Week × Hour)"),
-            dcc.Graph(figure=theme_fig(px.imshow(
-                heat_pivot,  # pass DF so labels render
-                aspect="auto",
-                labels=dict(color="Fraud Rate"),
-            )) if not heat_pivot.empty else theme_fig(px.imshow(
-                np.zeros((1,1)), aspect="auto", labels=dict(color="Fraud Rate")
-            ))),
-            html.Ul([html.Li(t) for t in insight_heatmap()], style={"color": DD_MUTE, "marginTop": "6px"}),
-            html.Div([bubble_btn("See: Temporal Guardrails", "temporal")], style={"margin": "4px 0 12px 0"}),
+            dcc.Graph(id="heat-graph"),
+            _ul("heatmap"),
+            _bub_row("See: Temporal Guardrails", "temporal"),
 
             section_title("Daily Chargeback & Fraud Rates"),
-            dcc.Graph(figure=theme_fig(px.line(daily, x="DATE", y=["chargeback_rate", "fraud_rate"]))),
-            html.Ul([html.Li(t) for t in insight_rates_trend()], style={"color": DD_MUTE, "marginTop": "6px"}),
+            dcc.Graph(id="trend-graph"),
+            _ul("trend"),
 
             section_title("Chargeback Cost Over Time ($)"),
-            dcc.Graph(figure=theme_fig(px.line(daily, x="DATE", y="cb_cost"))),
-            html.Ul([html.Li(t) for t in insight_cb_cost()], style={"color": DD_MUTE, "marginTop": "6px"}),
+            dcc.Graph(figure=_fig(px.line(daily, x="DATE", y="cb_cost"))),
+            _ul("cb_cost"),
 
             section_title("Average Sift Score & GOV Over Time"),
-            dcc.Graph(figure=theme_fig(px.line(daily, x="DATE", y=["avg_sift", "avg_gov"]))),
-            html.Ul([html.Li(t) for t in insight_sift_gov()], style={"color": DD_MUTE, "marginTop": "6px"}),
-            html.Div([bubble_btn("See: Sift Thresholds", "sift")], style={"margin": "4px 0 12px 0"}),
+            dcc.Graph(figure=_fig(px.line(daily_long, x="DATE", y="value", color="metric"))),
+            _ul("sift_gov"),
+            _bub_row("See: Sift Thresholds", "sift"),
 
             section_title("Fraud Rate by Platform"),
-            dcc.Graph(figure=theme_fig(px.bar(fraud_by_platform, x="PLATFORM", y="fraud_rate"))),
-            html.Ul([html.Li(t) for t in insight_platform()], style={"color": DD_MUTE, "marginTop": "6px"}),
-            html.Div([bubble_btn("See: Platform Guardrails", "platform")], style={"margin": "4px 0 12px 0"}),
+            dcc.Graph(figure=_fig(px.bar(fraud_by_platform, x="PLATFORM", y="fraud_rate"))),
+            _ul("platform"),
+            _bub_row("See: Platform Guardrails", "platform"),
 
             section_title("Fraud Rate vs Unique Addresses (lifetime)"),
-            dcc.Graph(figure=theme_fig(px.line(fraud_by_addr, x="CX_UNIQUE_ADDRESSES", y="fraud_rate"))),
-            html.Ul([html.Li(t) for t in insight_addresses()], style={"color": DD_MUTE, "marginTop": "6px"}),
-            html.Div([bubble_btn("See: Address Velocity Controls", "address_velocity")], style={"margin": "4px 0 12px 0"}),
+            dcc.Graph(figure=_fig(px.line(fraud_by_addr, x="CX_UNIQUE_ADDRESSES", y="fraud_rate"))),
+            _ul("addresses"),
+            _bub_row("See: Address Velocity Controls", "address_velocity"),
 
             section_title("Fraud Rate vs Failed Charges (1D)"),
-            dcc.Graph(figure=theme_fig(px.line(fraud_by_failed, x="FAIL_CHARGES_1D", y="fraud_rate"))),
-            html.Ul([html.Li(t) for t in insight_failed()], style={"color": DD_MUTE, "marginTop": "6px"}),
-            html.Div([bubble_btn("See: Failed Payments Step-up", "failed_payments")], style={"margin": "4px 0 12px 0"}),
+            dcc.Graph(figure=_fig(px.line(fraud_by_failed, x="FAIL_CHARGES_1D", y="fraud_rate"))),
+            _ul("failed"),
+            _bub_row("See: Failed Payments Step-up", "failed_payments"),
 
             section_title("Fraud Rate by GOV Bin"),
-            dcc.Graph(figure=theme_fig(px.bar(fraud_by_gov_bin, x="GOV_BIN", y="fraud_rate"))),
-            html.Ul([html.Li(t) for t in insight_govbin()], style={"color": DD_MUTE, "marginTop": "6px"}),
-            html.Div([bubble_btn("See: High-Value (GOV) Scrutiny", "gov")], style={"margin": "4px 0 12px 0"}),
+            dcc.Graph(figure=_fig(px.bar(fraud_by_gov_bin, x="GOV_BIN", y="fraud_rate"))),
+            _ul("govbin"),
+            _bub_row("See: High-Value (GOV) Scrutiny", "gov"),
         ],
     )
 
@@ -736,36 +1008,14 @@ def build_tabs():
             html.Br(),
             section_title("Top 20 Predictors (Higher |Correlation| ⇒ Stronger Signal)"),
             dcc.Graph(
-                figure=theme_fig(
-                    px.bar(
-                        (lambda _df:
-                            _df.head(20).sort_values("CorrelationWithFraud")
-                            if not _df.empty else
-                            pd.DataFrame({"CorrelationWithFraud": [], "Feature": []})
-                        )(pd.DataFrame({
-                            "Feature": (lambda s: s.index.tolist())(
-                                (df.select_dtypes(include=[np.number]).copy()
-                                    .assign(FRAUD_FLAG=df["FRAUD_FLAG"].astype(int))
-                                    .corr(numeric_only=True)["FRAUD_FLAG"]
-                                    .drop(labels=["FRAUD_FLAG","IS_FRAUDULENT_CHARGEBACK"], errors="ignore"))
-                            ),
-                            "CorrelationWithFraud": (lambda s: s.values)(
-                                (df.select_dtypes(include=[np.number]).copy()
-                                    .assign(FRAUD_FLAG=df["FRAUD_FLAG"].astype(int))
-                                    .corr(numeric_only=True)["FRAUD_FLAG"]
-                                    .drop(labels=["FRAUD_FLAG","IS_FRAUDULENT_CHARGEBACK"], errors="ignore"))
-                            )
-                        })) ,
-                        x="CorrelationWithFraud", y="Feature", orientation="h"
-                    )
-                )
+                figure=_fig(px.bar(pred_df, x="CorrelationWithFraud", y="Feature", orientation="h"))
             ),
             html.Ul(
                 [
                     html.Li("Signals are univariate; treat as directional, not causal."),
                     html.Li("Use for rules/threshold ideas, then validate with multivariate models or experiments."),
                 ],
-                style={"color": DD_MUTE, "marginTop": "6px"}
+                style=_INSIGHT_STYLE
             ),
             html.Div(
                 [
@@ -785,7 +1035,7 @@ def build_tabs():
         children=[
             html.Br(),
             section_title("Fraud Mitigation Recommendations"),
-            html.Div(id="rec-cards", style={
+            html.Div(PREBUILT_REC_CARDS, id="rec-cards", style={
                 "display": "grid",
                 "gridTemplateColumns": "repeat(auto-fit, minmax(320px, 1fr))",
                 "gap": "12px",
@@ -824,9 +1074,9 @@ def build_tabs():
                     info_card(
                         "Binning & Grouping",
                         [
-                            "- GOV risk bands use deciles: `qcut(GOV_DOLLARS, q=10, duplicates='drop')`.",
+                            "- GOV risk bands use deciles: `np.quantile` edges at 0, 0.1, …, 1 (right-closed like `qcut`, duplicate edges dropped).",
                             "- GOV bin labels are strings to avoid JSON serialization issues.",
-                            "- GroupBy calls pass `observed=False` for pandas compatibility.",
+                            "- Segment fraud rates use factorize + bincount; missing values are kept as their own group.",
                         ],
                     ),
                     info_card(
@@ -844,14 +1094,19 @@ def build_tabs():
     )
 
     glossary_items_table = dash_table.DataTable(
-        data=glossary_df.to_dict("records"),
-        columns=[{"name": col, "id": col} for col in glossary_df.columns],
+        id="glossary-items-table",
+        data=glossary_page(0, GLOSSARY_PAGE_SIZE, None),
+        columns=_GLOSSARY_COLS,
         style_table={"overflowX": "auto", "border": f"1px solid {DD_BORDER}"},
         style_header={"backgroundColor": "#FFF6F3", "fontWeight": "bold", "border": f"1px solid {DD_BORDER}"},
         style_cell={"textAlign": "left", "whiteSpace": "normal", "height": "auto", "border": f"1px solid {DD_BORDER}"},
-        page_size=10,
+        page_action="custom",
+        page_current=0,
+        page_size=GLOSSARY_PAGE_SIZE,
+        page_count=max(1, -(-len(glossary_df) // GLOSSARY_PAGE_SIZE)),
         filter_action="none",
-        sort_action="native",
+        sort_action="custom",  # native sort would only reorder the page in the browser
+        sort_mode="single",
     )
 
     glossary_tab = dcc.Tab(
@@ -864,8 +1119,8 @@ def build_tabs():
                     html.Div("Choose a field:", style={"color": DD_MUTE, "marginBottom": "6px", "fontSize": "13px"}),
                     dcc.Dropdown(
                         id="glossary-dropdown",
-                        options=[{"label": f, "value": f} for f in glossary_df["Field"]],
-                        value=glossary_df["Field"].iloc[0] if not glossary_df.empty else None,
+                        options=glossary_df["Field"].tolist(),
+                        value=glossary_df["Field"].iat[0] if not glossary_df.empty else None,
                         clearable=False,
                         searchable=False,
                         style={"border": f"1px solid {DD_BORDER}"}
@@ -894,6 +1149,9 @@ tabs_component, header_component, kpis_component, date_note_component = build_ta
 app.layout = html.Div(
     [
         dcc.Store(id="rec_target", data=None),   # which recommendation to focus
+        dcc.Store(id="fig-template", data=FIG_TEMPLATE),  # shared Plotly template for clientside figures
+        dcc.Store(id="heat-store", data=HEAT_STORE),      # heatmap shell + 7×24 matrix
+        dcc.Store(id="trend-store", data=TREND_STORE),    # daily rates shell + arrays
         header_component,                        # header with logo left + centered title/subtitle
         kpis_component,                          # KPIs
         date_note_component,                     # centered date note
@@ -909,6 +1167,11 @@ app.layout = html.Div(
     Input("glossary-dropdown", "value")
 )
 def show_glossary_definition(field):
+    return _build_def(field)
+
+@lru_cache(maxsize=256)
+def _build_def(field):
+    """Definition card per field (the dropdown only offers glossary fields, so this stays small)."""
     if not field:
         return html.Div()
     definition = glossary_map.get(field, "—")
@@ -928,13 +1191,45 @@ def show_glossary_definition(field):
         },
     )
 
-# Render recommendations, move selected to top + highlight
+# Glossary table: only the visible page goes over the wire (page_action="custom")
 @app.callback(
-    Output("rec-cards", "children"),
-    Input("rec_target", "data")
+    Output("glossary-items-table", "data"),
+    Input("glossary-items-table", "page_current"),
+    Input("glossary-items-table", "page_size"),
+    Input("glossary-items-table", "sort_by"),
+    prevent_initial_call=True
+)
+def page_glossary_items(page_current, page_size, sort_by):
+    return glossary_page(page_current, page_size, sort_by)
+
+# Static figures are assembled in the browser from their stores (assets/dashboard.js)
+for _graph, _store in [("heat-graph", "heat-store"), ("trend-graph", "trend-store")]:
+    app.clientside_callback(
+        ClientsideFunction(namespace="dd", function_name="figure"),
+        Output(_graph, "figure"),
+        Input(_store, "data"),
+        State("fig-template", "data"),
+    )
+
+# Highlight the selected recommendation and move it first (CSS grid `order`), in the browser
+app.clientside_callback(
+    """
+    function(selected, ids) {
+        var base = %s, hilite = %s;
+        return ids.map(function(id) {
+            var on = id.key === selected;
+            return Object.assign({}, on ? hilite : base, {order: on ? -1 : 0});
+        });
+    }
+    """ % (json.dumps(rec_card_style(False)), json.dumps(rec_card_style(True))),
+    Output({"type": "rec-card", "key": ALL}, "style"),
+    Input("rec_target", "data"),
+    State({"type": "rec-card", "key": ALL}, "id"),
 )
-def render_recommendations(selected_key):
-    return build_rec_cards(selected_key)
+
+# Pattern ids arrive as compact JSON, e.g. {"key":"sift","type":"rec-bubble"}
+_KEY_RE = re.compile(r'"key":"([^"]+)"')
+_REC_KEYS = frozenset(REC_DEFS)
 
 # Bubble router: any bubble click → set target + switch to Recommendations tab
 @app.callback(
@@ -945,15 +1240,15 @@ def render_recommendations(selected_key):
     prevent_initial_call=True
 )
 def route_to_recommendation(all_clicks, all_ids):
+    if not any(all_clicks):
+        return dash.no_update, dash.no_update
     ctx = dash.callback_context
     if not ctx.triggered:
         return dash.no_update, dash.no_update
     trig = ctx.triggered[0]["prop_id"].split(".")[0]
-    try:
-        key = json.loads(trig)["key"]
-    except Exception:
-        key = None
-    if key and key in REC_DEFS:
+    m = _KEY_RE.search(trig)
+    key = m.group(1) if m else None
+    if key in _REC_KEYS:
         return key, "recs"
     return dash.no_update, dash.no_update
 